@@ -51,6 +51,7 @@ from .const import (
     DATA_HOMES,
     DATA_PERSONS,
     DATA_SCHEDULES,
+    DATA_SCHEDULES_BY_NAME,
     DOMAIN,
     PLATFORMS,
     WEBHOOK_DEACTIVATION,
@@ -85,6 +86,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         DATA_PERSONS: {},
         DATA_DEVICE_IDS: {},
         DATA_SCHEDULES: {},
+        DATA_SCHEDULES_BY_NAME: {},
         DATA_HOMES: {},
         DATA_EVENTS: {},
         DATA_CAMERAS: {},
@@ -155,9 +155,7 @@ class NetatmoCamera(NetatmoBase, Camera):
                 self._monitoring = True
             elif data[WEBHOOK_PUSH_TYPE] == WEBHOOK_LIGHT_MODE:
                 self._light_state = data["sub_type"]
-                self._attr_extra_state_attributes.update(
-                    {"light_state": self._light_state}
-                )
+                self._attr_extra_state_attributes["light_state"] = self._light_state
 
             self.async_write_ha_state()
             return
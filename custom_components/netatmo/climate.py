@@ -1,10 +1,12 @@
 """Support for Netatmo Smart thermostats."""
 from __future__ import annotations
 
+from functools import cached_property
 import logging
-from typing import Any, cast
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any
 
-from .pyatmo.modules import NATherm1
 import voluptuous as vol
 
 from homeassistant.components.climate import (
@@ -17,8 +19,6 @@ from homeassistant.components.climate import (
     HVACAction,
     HVACMode,
 )
-from .pyatmo.modules.bticino import BNTH
-
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     ATTR_SUGGESTED_AREA,
@@ -39,11 +39,13 @@ from .const import (
     ATTR_SELECTED_SCHEDULE,
     CONF_URL_ENERGY,
     DATA_SCHEDULES,
+    DATA_SCHEDULES_BY_NAME,
     DOMAIN,
     EVENT_TYPE_CANCEL_SET_POINT,
     EVENT_TYPE_SCHEDULE,
     EVENT_TYPE_SET_POINT,
     EVENT_TYPE_THERM_MODE,
+    NETATMO_CLIMATE_EVENTS,
     NETATMO_CREATE_CLIMATE,
     SERVICE_SET_SCHEDULE,
 )
@@ -69,36 +71,47 @@ STATE_NETATMO_OFF = STATE_OFF
 STATE_NETATMO_MANUAL = "manual"
 STATE_NETATMO_HOME = "home"
 
-PRESET_MAP_NETATMO = {
-    PRESET_FROST_GUARD: STATE_NETATMO_HG,
-    PRESET_BOOST: STATE_NETATMO_MAX,
-    PRESET_SCHEDULE: STATE_NETATMO_SCHEDULE,
-    PRESET_AWAY: STATE_NETATMO_AWAY,
-    STATE_NETATMO_OFF: STATE_NETATMO_OFF,
-}
-
-NETATMO_MAP_PRESET = {
-    STATE_NETATMO_HG: PRESET_FROST_GUARD,
-    STATE_NETATMO_MAX: PRESET_BOOST,
-    STATE_NETATMO_SCHEDULE: PRESET_SCHEDULE,
-    STATE_NETATMO_AWAY: PRESET_AWAY,
-    STATE_NETATMO_OFF: STATE_NETATMO_OFF,
-    STATE_NETATMO_MANUAL: STATE_NETATMO_MANUAL,
-    STATE_NETATMO_HOME: PRESET_SCHEDULE,
-}
-
-HVAC_MAP_NETATMO = {
-    PRESET_SCHEDULE: HVACMode.AUTO,
-    STATE_NETATMO_HG: HVACMode.AUTO,
-    PRESET_FROST_GUARD: HVACMode.AUTO,
-    PRESET_BOOST: HVACMode.HEAT,
-    STATE_NETATMO_OFF: HVACMode.OFF,
-    STATE_NETATMO_MANUAL: HVACMode.AUTO,
-    PRESET_MANUAL: HVACMode.AUTO,
-    STATE_NETATMO_AWAY: HVACMode.AUTO,
-}
-
-CURRENT_HVAC_MAP_NETATMO = {True: HVACAction.HEATING, False: HVACAction.IDLE}
+PRESET_MAP_NETATMO = MappingProxyType(
+    {
+        PRESET_FROST_GUARD: STATE_NETATMO_HG,
+        PRESET_BOOST: STATE_NETATMO_MAX,
+        PRESET_SCHEDULE: STATE_NETATMO_SCHEDULE,
+        PRESET_AWAY: STATE_NETATMO_AWAY,
+        STATE_NETATMO_OFF: STATE_NETATMO_OFF,
+    }
+)
+
+NETATMO_MAP_PRESET = MappingProxyType(
+    {
+        STATE_NETATMO_HG: PRESET_FROST_GUARD,
+        STATE_NETATMO_MAX: PRESET_BOOST,
+        STATE_NETATMO_SCHEDULE: PRESET_SCHEDULE,
+        STATE_NETATMO_AWAY: PRESET_AWAY,
+        STATE_NETATMO_OFF: STATE_NETATMO_OFF,
+        STATE_NETATMO_MANUAL: STATE_NETATMO_MANUAL,
+        STATE_NETATMO_HOME: PRESET_SCHEDULE,
+    }
+)
+
+BOOST_PRESET_MODES = frozenset((PRESET_BOOST, STATE_NETATMO_MAX))
+THERM_MODE_PRESET_MODES = frozenset((PRESET_SCHEDULE, PRESET_FROST_GUARD, PRESET_AWAY))
+
+HVAC_MAP_NETATMO = MappingProxyType(
+    {
+        PRESET_SCHEDULE: HVACMode.AUTO,
+        STATE_NETATMO_HG: HVACMode.AUTO,
+        PRESET_FROST_GUARD: HVACMode.AUTO,
+        PRESET_BOOST: HVACMode.HEAT,
+        STATE_NETATMO_OFF: HVACMode.OFF,
+        STATE_NETATMO_MANUAL: HVACMode.AUTO,
+        PRESET_MANUAL: HVACMode.AUTO,
+        STATE_NETATMO_AWAY: HVACMode.AUTO,
+    }
+)
+
+CURRENT_HVAC_MAP_NETATMO = MappingProxyType(
+    {True: HVACAction.HEATING, False: HVACAction.IDLE}
+)
 
 DEFAULT_MAX_TEMP = 30
 
@@ -106,6 +119,18 @@ NA_THERM = "NATherm1"
 NA_VALVE = "NRV"
 NA_BNTH = "BNTH"
 
+# (is valve, is heating) -> room set point mode and temperature for boost
+BOOST_SETPOINT_MAP_NETATMO = MappingProxyType(
+    {
+        (True, True): (STATE_NETATMO_HOME, None),
+        (True, False): (STATE_NETATMO_MANUAL, DEFAULT_MAX_TEMP),
+        (False, True): (STATE_NETATMO_HOME, None),
+        (False, False): (STATE_NETATMO_MAX, None),
+    }
+)
+
+HVAC_OFF_MODELS = frozenset((NA_THERM, NA_BNTH))
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -140,6 +165,23 @@ class NetatmoThermostat(NetatmoBase, ClimateEntity):
     _attr_target_temperature_step = PRECISION_HALVES
     _attr_temperature_unit = TEMP_CELSIUS
 
+    _PRESET_TEMP_GETTERS = MappingProxyType(
+        {
+            PRESET_FROST_GUARD: attrgetter("_hg_temperature"),
+            PRESET_AWAY: attrgetter("_away_temperature"),
+        }
+    )
+    _SETPOINT_MODE_TABLE = MappingProxyType(
+        {
+            STATE_NETATMO_OFF: (HVACMode.OFF, STATE_NETATMO_OFF, 0),
+            STATE_NETATMO_MAX: (
+                HVACMode.HEAT,
+                PRESET_MAP_NETATMO[PRESET_BOOST],
+                DEFAULT_MAX_TEMP,
+            ),
+        }
+    )
+
     def __init__(self, netatmo_device: NetatmoRoom) -> None:
         """Initialize the sensor."""
         ClimateEntity.__init__(self)
@@ -150,14 +192,12 @@ class NetatmoThermostat(NetatmoBase, ClimateEntity):
         self._home_id = self._room.home.entity_id
 
         self._signal_name = f"{HOME}-{self._home_id}"
-        self._publishers.extend(
-            [
-                {
-                    "name": HOME,
-                    "home_id": self._room.home.entity_id,
-                    SIGNAL_NAME: self._signal_name,
-                },
-            ]
+        self._publishers.append(
+            {
+                "name": HOME,
+                "home_id": self._home_id,
+                SIGNAL_NAME: self._signal_name,
+            }
         )
         self._model: str = f"{self._room.climate_type}"
 
@@ -174,9 +214,10 @@ class NetatmoThermostat(NetatmoBase, ClimateEntity):
         self._hg_temperature: float | None = None
         self._boilerstatus: bool | None = None
         self._selected_schedule = None
+        self._domain_data: dict[str, Any] = {}
 
         self._attr_hvac_modes = [HVACMode.AUTO, HVACMode.HEAT]
-        if self._model == NA_THERM or self._model == NA_BNTH:
+        if self._model in HVAC_OFF_MODELS:
             self._attr_hvac_modes.append(HVACMode.OFF)
 
         self._attr_unique_id = f"{self._room.entity_id}-{self._model}"
@@ -185,95 +226,128 @@ class NetatmoThermostat(NetatmoBase, ClimateEntity):
         """Entity created."""
         await super().async_added_to_hass()
 
-        for event_type in (
-            EVENT_TYPE_SET_POINT,
-            EVENT_TYPE_THERM_MODE,
-            EVENT_TYPE_CANCEL_SET_POINT,
-            EVENT_TYPE_SCHEDULE,
-        ):
-            self.async_on_remove(
-                async_dispatcher_connect(
-                    self.hass,
-                    f"signal-{DOMAIN}-webhook-{event_type}",
-                    self.handle_event,
-                )
+        self._domain_data = self.hass.data[DOMAIN]
+
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                NETATMO_CLIMATE_EVENTS,
+                self.handle_events,
             )
+        )
 
     @callback
-    def handle_event(self, event: dict) -> None:
-        """Handle webhook events."""
+    def handle_events(self, events: list[dict]) -> None:
+        """Handle a batch of webhook events."""
+        updated = False
+        for event in events:
+            try:
+                updated |= self.handle_event(event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error handling webhook event %s", event)
+
+        if updated:
+            self.async_write_ha_state()
+
+    @callback
+    def handle_event(self, event: dict) -> bool:
+        """Handle a webhook event, return whether the state was updated."""
         data = event["data"]
 
-        if self._room.home.entity_id != data["home_id"]:
-            return
+        if self._home_id != data["home_id"]:
+            return False
 
-        if data["event_type"] == EVENT_TYPE_SCHEDULE and "schedule_id" in data:
-            self._selected_schedule = getattr(
-                self.hass.data[DOMAIN][DATA_SCHEDULES][self._room.home.entity_id].get(
-                    data["schedule_id"]
-                ),
-                "name",
-                None,
-            )
-            self._attr_extra_state_attributes[
-                ATTR_SELECTED_SCHEDULE
-            ] = self._selected_schedule
-            self.async_write_ha_state()
-            self.data_handler.async_force_update(self._signal_name)
-            return
+        if (handler := self._EVENT_HANDLERS.get(data["event_type"])) is None:
+            return False
 
-        home = data["home"]
+        return handler(self, event)
 
-        if self._room.home.entity_id != home["id"]:
-            return
+    @callback
+    def _handle_schedule(self, event: dict) -> bool:
+        """Handle schedule change events."""
+        data = event["data"]
 
-        if data["event_type"] == EVENT_TYPE_THERM_MODE:
-            self._attr_preset_mode = NETATMO_MAP_PRESET[home[EVENT_TYPE_THERM_MODE]]
-            self._attr_hvac_mode = HVAC_MAP_NETATMO[self._attr_preset_mode]
-            if self._attr_preset_mode == PRESET_FROST_GUARD:
-                self._attr_target_temperature = self._hg_temperature
-            elif self._attr_preset_mode == PRESET_AWAY:
-                self._attr_target_temperature = self._away_temperature
-            elif self._attr_preset_mode in [PRESET_SCHEDULE, PRESET_HOME]:
-                self.async_update_callback()
-                self.data_handler.async_force_update(self._signal_name)
-            self.async_write_ha_state()
-            return
+        if "schedule_id" not in data:
+            return False
+
+        self._selected_schedule = getattr(
+            self._domain_data[DATA_SCHEDULES][self._home_id].get(data["schedule_id"]),
+            "name",
+            None,
+        )
+        self._attr_extra_state_attributes[
+            ATTR_SELECTED_SCHEDULE
+        ] = self._selected_schedule
+        self.data_handler.async_force_update(self._signal_name)
+        return True
+
+    @callback
+    def _handle_therm_mode(self, event: dict) -> bool:
+        """Handle home thermostat mode events."""
+        home = event["data"]["home"]
+
+        if self._home_id != home["id"]:
+            return False
+
+        preset_mode = NETATMO_MAP_PRESET[home[EVENT_TYPE_THERM_MODE]]
+        self._attr_preset_mode = preset_mode
+        self._attr_hvac_mode = HVAC_MAP_NETATMO[preset_mode]
+        if (getter := self._PRESET_TEMP_GETTERS.get(preset_mode)) is not None:
+            self._attr_target_temperature = getter(self)
+        elif preset_mode in (PRESET_SCHEDULE, PRESET_HOME):
+            self.async_update_callback()
+            self.data_handler.async_force_update(self._signal_name)
+        return True
+
+    @callback
+    def _handle_set_point(self, event: dict) -> bool:
+        """Handle room set point events."""
+        if self._home_id != event["data"]["home"]["id"]:
+            return False
+
+        if (room := event.get("rooms_by_id", {}).get(self._id)) is None:
+            return False
+
+        mode = room["therm_setpoint_mode"]
+        if (entry := self._SETPOINT_MODE_TABLE.get(mode)) is not None:
+            (
+                self._attr_hvac_mode,
+                self._attr_preset_mode,
+                self._attr_target_temperature,
+            ) = entry
+        elif mode == STATE_NETATMO_MANUAL:
+            self._attr_hvac_mode = HVACMode.HEAT
+            self._attr_target_temperature = room["therm_setpoint_temperature"]
+        else:
+            self._attr_target_temperature = room["therm_setpoint_temperature"]
+            if self._attr_target_temperature == DEFAULT_MAX_TEMP:
+                self._attr_hvac_mode = HVACMode.HEAT
+        return True
 
-        for room in home.get("rooms", []):
-            if (
-                data["event_type"] == EVENT_TYPE_SET_POINT
-                and self._room.entity_id == room["id"]
-            ):
-                if room["therm_setpoint_mode"] == STATE_NETATMO_OFF:
-                    self._attr_hvac_mode = HVACMode.OFF
-                    self._attr_preset_mode = STATE_NETATMO_OFF
-                    self._attr_target_temperature = 0
-                elif room["therm_setpoint_mode"] == STATE_NETATMO_MAX:
-                    self._attr_hvac_mode = HVACMode.HEAT
-                    self._attr_preset_mode = PRESET_MAP_NETATMO[PRESET_BOOST]
-                    self._attr_target_temperature = DEFAULT_MAX_TEMP
-                elif room["therm_setpoint_mode"] == STATE_NETATMO_MANUAL:
-                    self._attr_hvac_mode = HVACMode.HEAT
-                    self._attr_target_temperature = room["therm_setpoint_temperature"]
-                else:
-                    self._attr_target_temperature = room["therm_setpoint_temperature"]
-                    if self._attr_target_temperature == DEFAULT_MAX_TEMP:
-                        self._attr_hvac_mode = HVACMode.HEAT
-                self.async_write_ha_state()
-                return
-
-            if (
-                data["event_type"] == EVENT_TYPE_CANCEL_SET_POINT
-                and self._room.entity_id == room["id"]
-            ):
-                if self._attr_hvac_mode == HVACMode.OFF:
-                    self._attr_hvac_mode = HVACMode.AUTO
-                    self._attr_preset_mode = PRESET_MAP_NETATMO[PRESET_SCHEDULE]
-
-                self.async_update_callback()
-                self.async_write_ha_state()
-                return
+    @callback
+    def _handle_cancel_set_point(self, event: dict) -> bool:
+        """Handle room set point cancellation events."""
+        if self._home_id != event["data"]["home"]["id"]:
+            return False
+
+        if self._id not in event.get("rooms_by_id", {}):
+            return False
+
+        if self._attr_hvac_mode == HVACMode.OFF:
+            self._attr_hvac_mode = HVACMode.AUTO
+            self._attr_preset_mode = PRESET_MAP_NETATMO[PRESET_SCHEDULE]
+
+        self.async_update_callback()
+        return True
+
+    _EVENT_HANDLERS = MappingProxyType(
+        {
+            EVENT_TYPE_SET_POINT: _handle_set_point,
+            EVENT_TYPE_THERM_MODE: _handle_therm_mode,
+            EVENT_TYPE_CANCEL_SET_POINT: _handle_cancel_set_point,
+            EVENT_TYPE_SCHEDULE: _handle_schedule,
+        }
+    )
 
     @property
     def hvac_action(self) -> HVACAction:
@@ -282,7 +356,7 @@ class NetatmoThermostat(NetatmoBase, ClimateEntity):
             return CURRENT_HVAC_MAP_NETATMO[self._boilerstatus]
         # Maybe it is a valve
         if (
-            heating_req := getattr(self._room, "heating_power_request", 0)
+            heating_req := self._room.heating_power_request
         ) is not None and heating_req > 0:
             return HVACAction.HEATING
         return HVACAction.IDLE
@@ -298,29 +372,13 @@ class NetatmoThermostat(NetatmoBase, ClimateEntity):
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
-        if (
-            preset_mode in (PRESET_BOOST, STATE_NETATMO_MAX)
-            and self._model == NA_VALVE
-            and self._attr_hvac_mode == HVACMode.HEAT
-        ):
+        if preset_mode in BOOST_PRESET_MODES:
             await self._room.async_therm_set(
-                STATE_NETATMO_HOME,
-            )
-        elif (
-            preset_mode in (PRESET_BOOST, STATE_NETATMO_MAX) and self._model == NA_VALVE
-        ):
-            await self._room.async_therm_set(
-                STATE_NETATMO_MANUAL,
-                DEFAULT_MAX_TEMP,
+                *BOOST_SETPOINT_MAP_NETATMO[
+                    (self._model == NA_VALVE, self._attr_hvac_mode == HVACMode.HEAT)
+                ]
             )
-        elif (
-            preset_mode in (PRESET_BOOST, STATE_NETATMO_MAX)
-            and self._attr_hvac_mode == HVACMode.HEAT
-        ):
-            await self._room.async_therm_set(STATE_NETATMO_HOME)
-        elif preset_mode in (PRESET_BOOST, STATE_NETATMO_MAX):
-            await self._room.async_therm_set(PRESET_MAP_NETATMO[preset_mode])
-        elif preset_mode in (PRESET_SCHEDULE, PRESET_FROST_GUARD, PRESET_AWAY):
+        elif preset_mode in THERM_MODE_PRESET_MODES:
             await self._room.home.async_set_thermmode(PRESET_MAP_NETATMO[preset_mode])
         else:
             _LOGGER.error("Preset mode '%s' not available", preset_mode)
@@ -373,19 +431,20 @@ class NetatmoThermostat(NetatmoBase, ClimateEntity):
 
         self._connected = True
 
-        self._away_temperature = self._room.home.get_away_temp()
-        self._hg_temperature = self._room.home.get_hg_temp()
+        home = self._room.home
+        self._away_temperature = home.get_away_temp()
+        self._hg_temperature = home.get_hg_temp()
         self._attr_current_temperature = self._room.therm_measured_temperature
         self._attr_target_temperature = self._room.therm_setpoint_temperature
-        self._attr_preset_mode = NETATMO_MAP_PRESET[
-            getattr(self._room, "therm_setpoint_mode", STATE_NETATMO_SCHEDULE)
+        preset_mode = NETATMO_MAP_PRESET[
+            self._room.therm_setpoint_mode or STATE_NETATMO_SCHEDULE
         ]
-        self._attr_hvac_mode = HVAC_MAP_NETATMO[self._attr_preset_mode]
-        self._away = self._attr_hvac_mode == HVAC_MAP_NETATMO[STATE_NETATMO_AWAY]
+        hvac_mode = HVAC_MAP_NETATMO[preset_mode]
+        self._attr_preset_mode = preset_mode
+        self._attr_hvac_mode = hvac_mode
+        self._away = hvac_mode == HVAC_MAP_NETATMO[STATE_NETATMO_AWAY]
 
-        self._selected_schedule = getattr(
-            self._room.home.get_selected_schedule(), "name", None
-        )
+        self._selected_schedule = getattr(home.get_selected_schedule(), "name", None)
         self._attr_extra_state_attributes[
             ATTR_SELECTED_SCHEDULE
         ] = self._selected_schedule
@@ -395,39 +454,35 @@ class NetatmoThermostat(NetatmoBase, ClimateEntity):
                 ATTR_HEATING_POWER_REQUEST
             ] = self._room.heating_power_request
         else:
-            for module in self._room.modules.values():
-                if hasattr(module, "boiler_status"):
-                    if "BNTH" in self._model:
-                        module = cast(BNTH, module)
-                    elif "NATherm1" in self._model:
-                        module = cast(NATherm1, module)
-                    if module.boiler_status is not None:
-                        self._boilerstatus = module.boiler_status
-                        break
+            self._boilerstatus = next(
+                (
+                    boiler_status
+                    for module in self._room.modules.values()
+                    if (boiler_status := getattr(module, "boiler_status", None))
+                    is not None
+                ),
+                self._boilerstatus,
+            )
 
     async def _async_service_set_schedule(self, **kwargs: Any) -> None:
         schedule_name = kwargs.get(ATTR_SCHEDULE_NAME)
-        schedule_id = None
-        for sid, schedule in self.hass.data[DOMAIN][DATA_SCHEDULES][
-            self._room.home.entity_id
-        ].items():
-            if schedule.name == schedule_name:
-                schedule_id = sid
-                break
+        schedule_id = self._domain_data[DATA_SCHEDULES_BY_NAME][self._home_id].get(
+            schedule_name
+        )
 
         if not schedule_id:
-            _LOGGER.error("%s is not a valid schedule", kwargs.get(ATTR_SCHEDULE_NAME))
+            _LOGGER.error("%s is not a valid schedule", schedule_name)
             return
 
         await self._room.home.async_switch_schedule(schedule_id=schedule_id)
         _LOGGER.debug(
             "Setting %s schedule to %s (%s)",
-            self._room.home.entity_id,
-            kwargs.get(ATTR_SCHEDULE_NAME),
+            self._home_id,
+            schedule_name,
             schedule_id,
         )
 
-    @property
+    @cached_property
     def device_info(self) -> DeviceInfo:
         """Return the device info for the thermostat."""
         device_info: DeviceInfo = super().device_info
@@ -42,6 +42,8 @@ NETATMO_CREATE_SENSOR = "netatmo_create_sensor"
 NETATMO_CREATE_SWITCH = "netatmo_create_switch"
 NETATMO_CREATE_WEATHER_SENSOR = "netatmo_create_weather_sensor"
 
+NETATMO_CLIMATE_EVENTS = "netatmo_climate_events"
+
 CONF_AREA_NAME = "area_name"
 CONF_CLOUDHOOK_URL = "cloudhook_url"
 CONF_LAT_NE = "lat_ne"
@@ -62,6 +64,7 @@ DATA_EVENTS = "netatmo_events"
 DATA_HOMES = "netatmo_homes"
 DATA_PERSONS = "netatmo_persons"
 DATA_SCHEDULES = "netatmo_schedules"
+DATA_SCHEDULES_BY_NAME = "netatmo_schedules_by_name"
 
 NETATMO_EVENT = "netatmo_event"
 NETATMO_WEBHOOK_URL = None
@@ -133,6 +136,12 @@ CLIMATE_TRIGGERS = [
     EVENT_TYPE_SET_POINT,
     EVENT_TYPE_THERM_MODE,
 ]
+CLIMATE_EVENTS = [
+    EVENT_TYPE_CANCEL_SET_POINT,
+    EVENT_TYPE_SCHEDULE,
+    EVENT_TYPE_SET_POINT,
+    EVENT_TYPE_THERM_MODE,
+]
 EVENT_ID_MAP = {
     EVENT_TYPE_ALARM_STARTED: "device_id",
     EVENT_TYPE_CAMERA_ANIMAL: "device_id",
@@ -19,14 +19,17 @@ from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 
 from .const import (
     AUTH,
+    CLIMATE_EVENTS,
     DATA_PERSONS,
     DATA_SCHEDULES,
+    DATA_SCHEDULES_BY_NAME,
     DOMAIN,
     MANUFACTURER,
+    NETATMO_CLIMATE_EVENTS,
     NETATMO_CREATE_BATTERY,
     NETATMO_CREATE_CAMERA,
     NETATMO_CREATE_CAMERA_LIGHT,
@@ -74,6 +77,7 @@ DEFAULT_INTERVALS = {
     EVENT: 600,
 }
 SCAN_INTERVAL = 60
+CLIMATE_EVENT_BATCH_DELAY = 0.05
 
 
 @dataclass
@@ -131,6 +135,8 @@ class NetatmoDataHandler:
         self.publisher: dict[str, NetatmoPublisher] = {}
         self._queue: deque = deque()
         self._webhook: bool = False
+        self._climate_events: list[dict] = []
+        self._climate_events_unsub: CALLBACK_TYPE | None = None
 
     async def async_setup(self) -> None:
         """Set up the Netatmo data handler."""
@@ -146,6 +152,16 @@ class NetatmoDataHandler:
             )
         )
 
+        for event_type in CLIMATE_EVENTS:
+            self.config_entry.async_on_unload(
+                async_dispatcher_connect(
+                    self.hass,
+                    f"signal-{DOMAIN}-webhook-{event_type}",
+                    self.async_queue_climate_event,
+                )
+            )
+        self.config_entry.async_on_unload(self.async_cancel_climate_events)
+
         self.account = pyatmo.AsyncAccount(self._auth)
 
         await self.subscribe(ACCOUNT, ACCOUNT, None)
@@ -193,6 +209,38 @@ class NetatmoDataHandler:
             _LOGGER.debug("%s camera reconnected", MANUFACTURER)
             self.async_force_update(ACCOUNT)
 
+    @callback
+    def async_queue_climate_event(self, event: dict) -> None:
+        """
+        Queue climate webhook events.
+
+        Events arriving within CLIMATE_EVENT_BATCH_DELAY are dispatched
+        together so that climate entities write their state once per batch.
+        """
+        self._climate_events.append(event)
+
+        if self._climate_events_unsub is None:
+            self._climate_events_unsub = async_call_later(
+                self.hass,
+                CLIMATE_EVENT_BATCH_DELAY,
+                self._async_dispatch_climate_events,
+            )
+
+    @callback
+    def _async_dispatch_climate_events(self, _: datetime) -> None:
+        """Dispatch the queued climate webhook events."""
+        self._climate_events_unsub = None
+        events, self._climate_events = self._climate_events, []
+        async_dispatcher_send(self.hass, NETATMO_CLIMATE_EVENTS, events)
+
+    @callback
+    def async_cancel_climate_events(self) -> None:
+        """Drop queued climate webhook events."""
+        if self._climate_events_unsub is not None:
+            self._climate_events_unsub()
+            self._climate_events_unsub = None
+        self._climate_events = []
+
     async def async_fetch_data(self, signal_name: str) -> None:
         """Fetch data and notify."""
         try:
@@ -393,12 +441,10 @@ class NetatmoDataHandler:
         self, home: pyatmo.Home, signal_home: str
     ) -> None:
         """Set up climate schedule per home."""
-        if NetatmoDeviceCategory.climate in [
-            next(iter(x)) for x in [room.features for room in home.rooms.values()] if x
-        ]:
-            self.hass.data[DOMAIN][DATA_SCHEDULES][home.entity_id] = self.account.homes[
-                home.entity_id
-            ].schedules
+        if NetatmoDeviceCategory.climate in {
+            next(iter(room.features)) for room in home.rooms.values() if room.features
+        }:
+            self.register_schedules(self.account.homes[home.entity_id])
 
             async_dispatcher_send(
                 self.hass,
@@ -410,3 +456,13 @@ class NetatmoDataHandler:
                     signal_home,
                 ),
             )
+
+    @callback
+    def register_schedules(self, home: pyatmo.Home) -> None:
+        """Store the schedules of a home along with a name to id index."""
+        self.hass.data[DOMAIN][DATA_SCHEDULES][home.entity_id] = home.schedules
+        # First schedule wins for duplicate names
+        self.hass.data[DOMAIN][DATA_SCHEDULES_BY_NAME][home.entity_id] = {
+            schedule.name: schedule_id
+            for schedule_id, schedule in reversed(home.schedules.items())
+        }
@@ -58,10 +58,7 @@ class Home:
             )
             for room in raw_data.get("rooms", [])
         }
-        self.schedules = {
-            s["id"]: Schedule(home=self, raw_data=s)
-            for s in raw_data.get(SCHEDULES, [])
-        }
+        self.update_schedules(raw_data)
         self.persons = {
             s["id"]: Person(home=self, raw_data=s) for s in raw_data.get("persons", [])
         }
@@ -112,10 +109,18 @@ class Home:
         for room in self.rooms.keys() - {m["id"] for m in raw_rooms}:
             self.rooms.pop(room)
 
+        self.update_schedules(raw_data)
+
+    def update_schedules(self, raw_data: RawData) -> None:
+        """Update schedules and remember the selected one."""
         self.schedules = {
             s["id"]: Schedule(home=self, raw_data=s)
             for s in raw_data.get(SCHEDULES, [])
         }
+        self._selected_schedule = next(
+            (schedule for schedule in self.schedules.values() if schedule.selected),
+            None,
+        )
 
     async def update(self, raw_data: RawData) -> None:
         for module in raw_data.get("errors", []):
@@ -155,10 +160,7 @@ class Home:
 
     def get_selected_schedule(self) -> Schedule | None:
         """Return selected schedule for given home."""
-        return next(
-            (schedule for schedule in self.schedules.values() if schedule.selected),
-            None,
-        )
+        return self._selected_schedule
 
     def is_valid_schedule(self, schedule_id: str) -> bool:
         """Check if valid schedule."""
@@ -12,6 +12,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .const import (
     CONF_URL_ENERGY,
     DATA_SCHEDULES,
+    DATA_SCHEDULES_BY_NAME,
     DOMAIN,
     EVENT_TYPE_SCHEDULE,
     NETATMO_CREATE_SELECT,
@@ -106,25 +107,29 @@ class NetatmoScheduleSelect(NetatmoBase, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        for sid, schedule in self.hass.data[DOMAIN][DATA_SCHEDULES][
-            self._home_id
-        ].items():
-            if schedule.name != option:
-                continue
-            _LOGGER.debug(
-                "Setting %s schedule to %s (%s)",
-                self._home_id,
-                option,
-                sid,
+        if (
+            sid := self.hass.data[DOMAIN][DATA_SCHEDULES_BY_NAME][self._home_id].get(
+                option
             )
-            await self._home.async_switch_schedule(schedule_id=sid)
-            break
+        ) is None:
+            return
+        _LOGGER.debug(
+            "Setting %s schedule to %s (%s)",
+            self._home_id,
+            option,
+            sid,
+        )
+        await self._home.async_switch_schedule(schedule_id=sid)
 
     @callback
     def async_update_callback(self) -> None:
         """Update the entity's state."""
         self._attr_current_option = getattr(self._home.get_selected_schedule(), "name")
-        self.hass.data[DOMAIN][DATA_SCHEDULES][self._home_id] = self._home.schedules
+        if (
+            self.hass.data[DOMAIN][DATA_SCHEDULES].get(self._home_id)
+            is not self._home.schedules
+        ):
+            self.data_handler.register_schedules(self._home)
         self._attr_options = [
             schedule.name for schedule in self._home.schedules.values()
         ]
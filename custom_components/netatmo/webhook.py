@@ -1,5 +1,7 @@
 """The Netatmo integration."""
 import logging
+import sys
+from typing import Any
 
 from aiohttp.web import Request
 
@@ -18,6 +20,7 @@ from .const import (
     DEFAULT_PERSON,
     DOMAIN,
     EVENT_ID_MAP,
+    EVENT_TYPE_THERM_MODE,
     NETATMO_EVENT,
 )
 
@@ -76,10 +79,22 @@ def async_evaluate_event(hass: HomeAssistant, event_data: dict) -> None:
 def async_send_event(hass: HomeAssistant, event_type: str, data: dict) -> None:
     """Send events."""
     _LOGGER.debug("%s: %s", event_type, data)
+    _intern_value(data, ATTR_EVENT_TYPE)
+    signal_data: dict[str, Any] = {"type": event_type, "data": data}
+
+    # Intern climate modes and index rooms once for all room entities
+    if isinstance(home := data.get("home"), dict):
+        _intern_value(home, EVENT_TYPE_THERM_MODE)
+        rooms_by_id = {}
+        for room in home.get("rooms", []):
+            _intern_value(room, "therm_setpoint_mode")
+            rooms_by_id[room["id"]] = room
+        signal_data["rooms_by_id"] = rooms_by_id
+
     async_dispatcher_send(
         hass,
         f"signal-{DOMAIN}-webhook-{event_type}",
-        {"type": event_type, "data": data},
+        signal_data,
     )
 
     event_data = {
@@ -97,3 +112,9 @@ def async_send_event(hass: HomeAssistant, event_type: str, data: dict) -> None:
         event_type=NETATMO_EVENT,
         event_data=event_data,
     )
+
+
+def _intern_value(data: dict, key: str) -> None:
+    """Intern a string value parsed from the webhook payload."""
+    if isinstance(value := data.get(key), str):
+        data[key] = sys.intern(value)